@@ -7,6 +7,7 @@ The corpus is deterministic: given the same seed, it produces identical output.
 
 Usage:
     python3 scripts/generate_perf_corpus.py [--seed SEED] [--output-dir DIR] [--scale SCALE]
+        [--jobs N] [--threads] [--cache]
 
 Output (default scale=1.0):
     - tweets.js: 10,000 tweets
@@ -24,10 +25,21 @@ import argparse
 import hashlib
 import json
 import random
+import shutil
 import sys
-from datetime import datetime, timedelta, timezone
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import cycle, islice
+from json.encoder import encode_basestring
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 # Deterministic seed for reproducibility
 DEFAULT_SEED = 42
@@ -53,16 +65,76 @@ SAMPLE_TEXTS = [
 ]
 
 UNICODE_TEXTS = [
-    "Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80",
+    "Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \U0001f389\U0001f680",
     "\u65e5\u672c\u8a9e\u3067\u30c4\u30a4\u30fc\u30c8\u3092\u66f8\u304f - Japanese tweet test",
     "\u0645\u0631\u062d\u0628\u0627 \u0628\u0627\u0644\u0639\u0627\u0644\u0645 - Arabic RTL text support",
     "\u4e2d\u6587\u6d4b\u8bd5 - Chinese character support test",
-    "\ud83d\udc68\u200d\ud83d\udcbb\ud83d\udc69\u200d\ud83d\udcbb Code together! \ud83d\ude80\u2728\ud83c\udf1f",
+    "\U0001f468\u200d\U0001f4bb\U0001f469\u200d\U0001f4bb Code together! \U0001f680\u2728\U0001f31f",
 ]
 
 HASHTAGS = ["rust", "programming", "tech", "coding", "software", "dev", "opensource",
             "machinelearning", "ai", "webdev", "linux", "python", "javascript", "cloud"]
 
+# Every tweet uses up to 3 consecutive hashtags starting at i % len(HASHTAGS);
+# precompute each run and the text suffix it produces, keyed by (count, start).
+HASHTAG_RUNS = {
+    (n, start): tuple(HASHTAGS[(start + j) % len(HASHTAGS)] for j in range(n))
+    for n in range(4)
+    for start in range(len(HASHTAGS))
+}
+HASHTAG_SUFFIX = {
+    key: "".join(f" #{h}" for h in run)
+    for key, run in HASHTAG_RUNS.items()
+}
+
+# Tweets all share one schema, so they are rendered straight from a template
+# laid out exactly like ``json.dumps(tweets, indent=2)`` renders each element.
+TWEET_TEMPLATE = """\
+  {{
+    "tweet": {{
+      "id": "{id}",
+      "id_str": "{id}",
+      "created_at": "{created_at}",
+      "full_text": {full_text},
+      "truncated": false,
+      "source": "<a href=\\"https://mobile.x.com\\" rel=\\"nofollow\\">X for iPhone</a>",
+      "favorite_count": "{favorites}",
+      "retweet_count": "{retweets}",
+      "lang": "en",
+      "entities": {{
+        "hashtags": {hashtags},
+        "user_mentions": [],
+        "urls": []
+      }}{reply}
+    }}
+  }}"""
+
+TWEET_REPLY_TEMPLATE = (
+    ',\n      "in_reply_to_status_id": "{reply_id}"'
+    ',\n      "in_reply_to_status_id_str": "{reply_id}"'
+    ',\n      "in_reply_to_user_id": "{user_id}"'
+    ',\n      "in_reply_to_screen_name": "user_{user_idx}"'
+)
+
+# Hashtags are plain ASCII words, so their entities need no JSON escaping.
+HASHTAG_ENTITY_TEMPLATE = """\
+          {{
+            "text": "{text}",
+            "indices": [
+              0,
+              {end}
+            ]
+          }}"""
+
+LIKE_TEMPLATE = """\
+  {
+    "like": {
+      "tweetId": "%d",
+      "fullText": %s,
+      "expandedUrl": "https://x.com/user_%d/status/%d"
+    }
+  }"""
+
 MENTIONS = ["@rustlang", "@github", "@microsoft", "@google", "@anthropic",
             "@elonmusk", "@openai", "@vercel", "@nodejs", "@typescriptlang"]
 
@@ -74,6 +146,35 @@ DM_TOPICS = [
     ("code review", "Can you take a look at my PR?"),
 ]
 
+DM_REPLIES = [
+    "That makes sense, thanks!",
+    "Got it, I'll check that out.",
+    "Interesting perspective.",
+    "Can you elaborate on that?",
+    "Perfect, that helps a lot!",
+]
+
+DM_CONVERSATION_TEMPLATE = """\
+  {
+    "dmConversation": {
+      "conversationId": "%d",
+      "messages": %s
+    }
+  }"""
+
+DM_MESSAGE_TEMPLATE = """\
+        {
+          "messageCreate": {
+            "id": "%d",
+            "senderId": "%d",
+            "recipientId": "%d",
+            "text": %s,
+            "createdAt": "%s",
+            "mediaUrls": [],
+            "urls": []
+          }
+        }"""
+
 GROK_TOPICS = [
     ("How does async/await work in Rust?", "Let me explain async/await in Rust..."),
     ("What's the best way to learn ML?", "Here are some great resources for machine learning..."),
@@ -83,182 +184,234 @@ GROK_TOPICS = [
 ]
 
 
-def deterministic_hash(s: str) -> int:
-    """Generate a deterministic hash from a string."""
-    return int(hashlib.sha256(s.encode()).hexdigest()[:16], 16)
+def deterministic_hash(s: str, key: bytes = b"xf-perf!") -> int:
+    """Generate a deterministic 64-bit hash from a string.
+
+    Uses keyed BLAKE2b with an 8-byte digest, which is much cheaper than
+    SHA256 for short inputs, and reads the digest directly as an integer.
+    """
+    return int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8, key=key).digest(), "big")
+
+
+# Timestamp formats, split around the "HH:MM:SS" clock so the date parts
+# only need formatting once per day.
+# X format: "Fri Jan 09 15:12:21 +0000 2026"
+X_TIMESTAMP_FORMAT = ("%a %b %d ", " +0000 %Y")
+ISO_TIMESTAMP_FORMAT = ("%Y-%m-%dT", ".000Z")
+
+# Clock tokens: "HH:MM:" for every minute of the day and "SS" for every second
+CLOCK_MINUTES = tuple(f"{m // 60:02d}:{m % 60:02d}:" for m in range(24 * 60))
+CLOCK_SECONDS = tuple(f"{s:02d}" for s in range(60))
+
+
+def timestamp_column(
+    fmt: tuple[str, str],
+    base: datetime,
+    total: int,
+    hours: list[int],
+    minutes: list[int] | None = None,
+) -> list[str]:
+    """Format the timestamps of records 0..len(hours)-1 in one pass.
+
+    Record i is placed ``(total - i) * 5 years / total`` days before ``base``
+    (spreading timestamps over 5 years), minus its hour and minute offsets.
+    The arithmetic is done on integer epoch seconds. ``fmt`` is a
+    (date prefix, date suffix) pair of ``time.strftime`` formats placed around
+    the clock; they are formatted once per distinct day, and each timestamp is
+    assembled from those and the precomputed clock tokens.
+    """
+    prefix_fmt, suffix_fmt = fmt
+    base_seconds = int(base.timestamp())
+    if minutes is None:
+        minutes = [0] * len(hours)
+    days = {}
+    column = []
+    for i, (hour, minute) in enumerate(zip(hours, minutes)):
+        seconds = base_seconds - (total - i) * 365 * 5 // total * 86400 - hour * 3600 - minute * 60
+        day, second_of_day = divmod(seconds, 86400)
+        date_parts = days.get(day)
+        if date_parts is None:
+            day_start = time.gmtime(day * 86400)
+            date_parts = days[day] = (time.strftime(prefix_fmt, day_start),
+                                      time.strftime(suffix_fmt, day_start))
+        column.append(date_parts[0] + CLOCK_MINUTES[second_of_day // 60]
+                      + CLOCK_SECONDS[second_of_day % 60] + date_parts[1])
+    return column
+
+
+def tweet_numerics(rng: random.Random, count: int) -> tuple[list[int], ...]:
+    """Compute every random and numeric per-tweet value in one tight pass.
+
+    Random values are drawn in exactly the order the per-tweet code used to
+    consume them, so the RNG stream (and the corpus checksums) are unchanged.
+    Entries that a tweet does not use are left at 0.
+
+    Returns (short_cut, favorites, retweets, hours, minutes, reply_ids) lists.
+    """
+    random_ = rng.random
+    randrange = rng.randrange  # randrange(a, b + 1) draws the same bits as randint(a, b)
+    short_cut = [0] * count
+    favorites = [0] * count
+    retweets = [0] * count
+    hours = [0] * count
+    minutes = [0] * count
+    reply_ids = [0] * count
 
+    for i in range(count):
+        if i % 100 == 0:
+            short_cut[i] = randrange(1, 51)
+        # Deterministic engagement metrics with realistic distribution
+        fav = int((count - i) * random_() * 0.1)  # More recent = less likes (newer)
+        favorites[i] = fav
+        retweets[i] = int(fav * 0.3 * random_())
+        hours[i] = randrange(24)
+        minutes[i] = randrange(60)
+        if i % 20 == 0 and i > 0:
+            reply_ids[i] = 1_000_000_000_000 + i - randrange(1, min(i, 10) + 1)
 
-def generate_timestamp(rng: random.Random, base: datetime, i: int, total: int) -> str:
-    """Generate a timestamp in X archive format."""
-    # Spread timestamps over 5 years
-    days_offset = int((total - i) * 365 * 5 / total)
-    hours_offset = rng.randint(0, 23)
-    minutes_offset = rng.randint(0, 59)
-    dt = base - timedelta(days=days_offset, hours=hours_offset, minutes=minutes_offset)
-    # X format: "Fri Jan 09 15:12:21 +0000 2026"
-    return dt.strftime("%a %b %d %H:%M:%S +0000 %Y")
+    return short_cut, favorites, retweets, hours, minutes, reply_ids
 
 
-def generate_iso_timestamp(rng: random.Random, base: datetime, i: int, total: int) -> str:
-    """Generate ISO 8601 timestamp."""
-    days_offset = int((total - i) * 365 * 5 / total)
-    hours_offset = rng.randint(0, 23)
-    dt = base - timedelta(days=days_offset, hours=hours_offset)
-    return dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+def draw_hours(rng: random.Random, count: int) -> list[int]:
+    """Draw the per-record hour offsets used by ISO timestamps."""
+    randrange = rng.randrange
+    return [randrange(24) for _ in range(count)]
 
 
-def generate_tweets(rng: random.Random, count: int) -> list[dict]:
-    """Generate deterministic tweet data."""
-    base_time = GENERATION_TIMESTAMP
-    tweets = []
+# Quote a string as JSON, identical to ``json.dumps(s, ensure_ascii=False)``.
+# This is the encoder's C string escaper itself, bound directly so the hot
+# render loops skip both ``json.dumps`` dispatch and an extra Python call. It
+# already works in two passes (size the output, then fill a single buffer),
+# so clean text costs one scan and one allocation.
+escape_json_fast = encode_basestring
 
-    for i in range(count):
-        # Deterministic text selection with some variation
-        text_idx = i % len(SAMPLE_TEXTS)
-        text = SAMPLE_TEXTS[text_idx]
-
-        # Add unicode content every 50th tweet
-        if i % 50 == 0 and i > 0:
-            text = UNICODE_TEXTS[i % len(UNICODE_TEXTS)]
-
-        # Add hashtags deterministically
-        num_hashtags = (i % 4)
-        hashtags_used = [HASHTAGS[(i + j) % len(HASHTAGS)] for j in range(num_hashtags)]
-        if hashtags_used:
-            text += " " + " ".join(f"#{h}" for h in hashtags_used)
-
-        # Add mentions deterministically
-        if i % 10 == 0:
-            mention = MENTIONS[i % len(MENTIONS)]
-            text = f"{mention} {text}"
-
-        # Vary text length (1-280 chars)
-        if i % 100 == 0:
-            text = text[:rng.randint(1, 50)]  # Short tweets
-        elif len(text) > 280:
-            text = text[:280]
 
-        # Deterministic engagement metrics with realistic distribution
-        favorites = int((count - i) * rng.random() * 0.1)  # More recent = less likes (newer)
-        retweets = int(favorites * 0.3 * rng.random())
-
-        tweet = {
-            "tweet": {
-                "id": str(1_000_000_000_000 + i),
-                "id_str": str(1_000_000_000_000 + i),
-                "created_at": generate_timestamp(rng, base_time, i, count),
-                "full_text": text,
-                "truncated": False,
-                "source": '<a href="https://mobile.x.com" rel="nofollow">X for iPhone</a>',
-                "favorite_count": str(favorites),
-                "retweet_count": str(retweets),
-                "lang": "en",
-                "entities": {
-                    "hashtags": [{"text": h, "indices": [0, len(h)+1]} for h in hashtags_used],
-                    "user_mentions": [],
-                    "urls": [],
-                },
-            }
-        }
+def render_hashtag_entities(hashtags_used: tuple[str, ...]) -> str:
+    """Render a tweet's ``entities.hashtags`` list at its nesting depth."""
+    if not hashtags_used:
+        return "[]"
+    entities = ",\n".join(
+        HASHTAG_ENTITY_TEMPLATE.format(text=h, end=len(h)+1) for h in hashtags_used
+    )
+    return "[\n" + entities + "\n        ]"
 
-        # Add reply chain for some tweets
-        if i % 20 == 0 and i > 0:
-            reply_to_id = str(1_000_000_000_000 + i - rng.randint(1, min(i, 10)))
-            tweet["tweet"]["in_reply_to_status_id"] = reply_to_id
-            tweet["tweet"]["in_reply_to_status_id_str"] = reply_to_id
-            tweet["tweet"]["in_reply_to_user_id"] = str(100000 + (i % 100))
-            tweet["tweet"]["in_reply_to_screen_name"] = f"user_{i % 100}"
 
-        tweets.append(tweet)
+def render_tweets(count: int, numerics: tuple[list[int], ...]) -> Iterator[str]:
+    """Yield deterministic tweets, pre-rendered from ``TWEET_TEMPLATE``.
 
-    return tweets
+    Only ``full_text`` goes through the JSON encoder (for escaping); no
+    per-tweet dicts are built. Uses precomputed ``tweet_numerics``.
+    """
+    base_time = GENERATION_TIMESTAMP
+    short_cut, favorites, retweets, hours, minutes, reply_ids = numerics
+    created_at = timestamp_column(X_TIMESTAMP_FORMAT, base_time, count, hours, minutes)
+    # Only 4 x 14 hashtag runs exist; render each entities list once and share it.
+    hashtag_entities = {key: render_hashtag_entities(run) for key, run in HASHTAG_RUNS.items()}
+
+    # Expand every per-index cycle into a column up front, so the tweet loop
+    # below is list lookups rather than a handful of modulos per tweet.
+    # Deterministic text selection with some variation
+    texts = list(islice(cycle(SAMPLE_TEXTS), count))
+    # Add unicode content every 50th tweet
+    for i in range(50, count, 50):
+        texts[i] = UNICODE_TEXTS[i % len(UNICODE_TEXTS)]
+    # Add hashtags deterministically
+    hashtag_keys = list(zip(cycle(range(4)), islice(cycle(range(len(HASHTAGS))), count)))
+    # Add mentions deterministically
+    mentions = [""] * count
+    for i in range(0, count, 10):
+        mentions[i] = MENTIONS[i % len(MENTIONS)] + " "
+    # Add reply chain for some tweets
+    replies = [""] * count
+    for i in range(20, count, 20):
+        replies[i] = TWEET_REPLY_TEMPLATE.format(
+            reply_id=reply_ids[i],
+            user_id=100000 + (i % 100),
+            user_idx=i % 100,
+        )
+
+    for i, text, hashtag_key, mention, cut, reply, timestamp, favorite_count, retweet_count in zip(
+        range(count), texts, hashtag_keys, mentions, short_cut, replies,
+        created_at, favorites, retweets,
+    ):
+        text = mention + text + HASHTAG_SUFFIX[hashtag_key]
+
+        # Vary text length (1-280 chars); only every 100th tweet has a cut
+        if cut:
+            text = text[:cut]  # Short tweets
+        elif len(text) > 280:
+            text = text[:280]
 
+        yield TWEET_TEMPLATE.format(
+            id=1_000_000_000_000 + i,
+            created_at=timestamp,
+            full_text=escape_json_fast(text),
+            favorites=favorite_count,
+            retweets=retweet_count,
+            hashtags=hashtag_entities[hashtag_key],
+            reply=reply,
+        )
 
-def generate_likes(rng: random.Random, count: int) -> list[dict]:
-    """Generate deterministic like data."""
-    likes = []
 
+def render_likes(count: int) -> Iterator[str]:
+    """Yield deterministic likes, pre-rendered from ``LIKE_TEMPLATE``."""
+    texts_json = [escape_json_fast(text) for text in SAMPLE_TEXTS]
     for i in range(count):
-        text_idx = i % len(SAMPLE_TEXTS)
-        text = SAMPLE_TEXTS[text_idx]
-
+        tweet_id = 2_000_000_000_000 + i
         # Some likes have missing text (like real X exports)
-        if i % 10 == 0:
-            text = None
-
-        like = {
-            "like": {
-                "tweetId": str(2_000_000_000_000 + i),
-                "fullText": text,
-                "expandedUrl": f"https://x.com/user_{i % 1000}/status/{2_000_000_000_000 + i}",
-            }
-        }
-        likes.append(like)
+        text_json = "null" if i % 10 == 0 else texts_json[i % len(SAMPLE_TEXTS)]
+        yield LIKE_TEMPLATE % (tweet_id, text_json, i % 1000, tweet_id)
 
-    return likes
 
+def render_direct_messages(message_count: int, convo_count: int, hours: list[int]) -> Iterator[str]:
+    """Yield deterministic DM conversations, pre-rendered from templates.
 
-def generate_direct_messages(rng: random.Random, message_count: int, convo_count: int) -> list[dict]:
-    """Generate deterministic DM data with conversations."""
+    ``hours`` holds one drawn hour offset per generated message. Message
+    fields are built column by column for the whole file up front; each
+    conversation then only formats its slice of the columns.
+    """
     base_time = GENERATION_TIMESTAMP
-    conversations = []
     messages_per_convo = message_count // convo_count
+    total = convo_count * messages_per_convo
+    created_at = timestamp_column(ISO_TIMESTAMP_FORMAT, base_time, message_count, hours)
+
+    convo_of = [g // messages_per_convo for g in range(total)]
+    msg_of = [g % messages_per_convo for g in range(total)]
+    ids = [4_000_000_000_000 + g for g in range(total)]
+    # Alternate between participants
+    sender_ids = [(100000 if m % 2 == 0 else 200000) + c for c, m in zip(convo_of, msg_of)]
+    recipient_ids = [(200000 if m % 2 == 0 else 100000) + c for c, m in zip(convo_of, msg_of)]
+
+    openers = [escape_json_fast(f"Hey! {topic_q}") for topic_q, _ in DM_TOPICS]
+    answers = [escape_json_fast(topic_a) for _, topic_a in DM_TOPICS]
+    replies = [escape_json_fast(text) for text in DM_REPLIES]
+    texts_json = [
+        openers[c % len(DM_TOPICS)] if m == 0
+        else answers[c % len(DM_TOPICS)] if m == 1
+        else replies[m % len(DM_REPLIES)]
+        for c, m in zip(convo_of, msg_of)
+    ]
 
     for convo_idx in range(convo_count):
-        convo_id = str(3_000_000_000_000 + convo_idx)
-        participant_ids = [str(100000 + convo_idx), str(200000 + convo_idx)]
-        messages = []
-
-        topic_idx = convo_idx % len(DM_TOPICS)
-        topic_q, topic_a = DM_TOPICS[topic_idx]
-
-        for msg_idx in range(messages_per_convo):
-            global_idx = convo_idx * messages_per_convo + msg_idx
-            sender_idx = msg_idx % 2
-
-            # Alternate between participants
-            if msg_idx == 0:
-                text = f"Hey! {topic_q}"
-            elif msg_idx == 1:
-                text = topic_a
-            else:
-                texts = [
-                    "That makes sense, thanks!",
-                    "Got it, I'll check that out.",
-                    "Interesting perspective.",
-                    "Can you elaborate on that?",
-                    "Perfect, that helps a lot!",
-                ]
-                text = texts[msg_idx % len(texts)]
-
-            message = {
-                "messageCreate": {
-                    "id": str(4_000_000_000_000 + global_idx),
-                    "senderId": participant_ids[sender_idx],
-                    "recipientId": participant_ids[1 - sender_idx],
-                    "text": text,
-                    "createdAt": generate_iso_timestamp(rng, base_time, global_idx, message_count),
-                    "mediaUrls": [],
-                    "urls": [],
-                }
-            }
-            messages.append(message)
-
-        conversation = {
-            "dmConversation": {
-                "conversationId": convo_id,
-                "messages": messages,
-            }
-        }
-        conversations.append(conversation)
-
-    return conversations
-
-
-def generate_grok_messages(rng: random.Random, count: int) -> list[dict]:
-    """Generate deterministic Grok chat items."""
+        rows = slice(convo_idx * messages_per_convo, (convo_idx + 1) * messages_per_convo)
+        messages = ",\n".join(
+            DM_MESSAGE_TEMPLATE % row
+            for row in zip(ids[rows], sender_ids[rows], recipient_ids[rows],
+                           texts_json[rows], created_at[rows])
+        )
+        yield DM_CONVERSATION_TEMPLATE % (
+            3_000_000_000_000 + convo_idx,
+            "[\n" + messages + "\n      ]" if messages else "[]",
+        )
+
+
+def iter_grok_messages(count: int, hours: list[int]) -> Iterator[dict]:
+    """Yield deterministic Grok chat items.
+
+    ``hours`` holds one drawn hour offset per message.
+    """
     base_time = GENERATION_TIMESTAMP
-    messages = []
+    created_at = timestamp_column(ISO_TIMESTAMP_FORMAT, base_time, count, hours)
 
     for i in range(count):
         topic_idx = (i // 2) % len(GROK_TOPICS)
@@ -278,20 +431,116 @@ def generate_grok_messages(rng: random.Random, count: int) -> list[dict]:
                 "chatId": chat_id,
                 "message": text,
                 "sender": sender,
-                "createdAt": generate_iso_timestamp(rng, base_time, i, count),
+                "createdAt": created_at[i],
                 "grokMode": "default",
             }
         }
-        messages.append(message)
-
-    return messages
-
-
-def write_js_file(path: Path, var_name: str, data: list | dict) -> str:
-    """Write data in X archive JavaScript format and return SHA256."""
-    content = f"window.YTD.{var_name}.part0 = {json.dumps(data, indent=2)}"
-    path.write_text(content, encoding="utf-8")
-    return hashlib.sha256(content.encode()).hexdigest()
+        yield message
+
+
+def encode_json(data: list | dict) -> bytes:
+    """Encode data as 2-space indented UTF-8 JSON, using orjson when available.
+
+    Non-ASCII text is written as UTF-8 rather than ``\\uXXXX`` escapes, so
+    orjson and ``json.dumps(data, indent=2, ensure_ascii=False)`` produce
+    identical bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_js_file(path: Path, var_name: str, data: list | dict) -> tuple[str, int]:
+    """Write data in X archive JavaScript format; return SHA256 and size in bytes."""
+    content = b"window.YTD." + var_name.encode() + b".part0 = " + encode_json(data)
+    path.write_bytes(content)
+    return hashlib.sha256(content).hexdigest(), len(content)
+
+
+def encode_element(record: dict) -> bytes:
+    """Encode one record as it appears inside an indented top-level array."""
+    # JSON strings never contain raw newlines, so re-indenting is safe.
+    return b"  " + encode_json(record).replace(b"\n", b"\n  ")
+
+
+# Streamed output is written and hashed in blocks of about this size. Each
+# block is a single write() that bypasses the file's own 8 KiB buffer, so a
+# multi-megabyte file costs only a handful of write syscalls.
+STREAM_BLOCK_BYTES = 1 << 20
+
+# Corpora estimated below this size are buffered whole and written with one
+# write per file; larger ones are streamed in STREAM_BLOCK_BYTES blocks so
+# memory stays flat. The estimate is ESTIMATED_BYTES_PER_RECORD per record.
+BUFFERED_OUTPUT_LIMIT = 50_000_000
+ESTIMATED_BYTES_PER_RECORD = 1000
+
+# Data files generated under <output-dir>/data, in generation order
+DATA_FILES = ("tweets.js", "like.js", "direct-messages.js", "grok-chat-item.js")
+
+
+def stream_js_file(
+    path: Path,
+    var_name: str,
+    records: Iterable[dict | str],
+    block_bytes: int | None = STREAM_BLOCK_BYTES,
+) -> tuple[str, int, int]:
+    """Stream records to a JavaScript array file; return SHA256, record count and size.
+
+    Records are encoded one at a time and collected into blocks of roughly
+    ``block_bytes``; each block is written and fed to the hash as it is
+    flushed, so memory stays bounded by the block size. With
+    ``block_bytes=None`` the whole file is instead buffered in memory and
+    written once. Either way the file is never read back. A record
+    may also be a ``str`` that is already rendered as an indented array
+    element. The output is identical to ``write_js_file`` with the
+    materialized list.
+    """
+    sha = hashlib.sha256()
+    count = 0
+    size = 0
+    block = bytearray(b"window.YTD." + var_name.encode() + b".part0 = ")
+    with path.open("wb") as fh:
+        for record in records:
+            block += b",\n" if count else b"[\n"
+            block += record.encode() if isinstance(record, str) else encode_element(record)
+            count += 1
+            if block_bytes is not None and len(block) >= block_bytes:
+                fh.write(block)
+                sha.update(block)
+                size += len(block)
+                block.clear()
+        block += b"\n]" if count else b"[]"
+        fh.write(block)
+        sha.update(block)
+        size += len(block)
+    return sha.hexdigest(), count, size
+
+
+def generate_js_file(
+    path: Path,
+    var_name: str,
+    block_bytes: int | None,
+    iter_records: Callable[..., Iterable[dict | str]],
+    *args,
+) -> tuple[str, int, int]:
+    """Generate one data file from ``iter_records(*args)``.
+
+    This is a top-level function so it can be dispatched to worker processes.
+    """
+    return stream_js_file(path, var_name, iter_records(*args), block_bytes)
+
+
+def make_executor(jobs: int, threads: bool) -> Executor:
+    """Create the pool the data files are generated on.
+
+    Processes give real parallelism for the pure-Python record generation.
+    Threads skip process start-up and argument pickling (noticeable with the
+    spawn start method on Windows and macOS); they still overlap file writes,
+    which release the GIL, but encoding itself stays serialized.
+    """
+    if threads:
+        return ThreadPoolExecutor(max_workers=jobs)
+    return ProcessPoolExecutor(max_workers=jobs)
 
 
 def generate_manifest(
@@ -355,6 +604,128 @@ def generate_manifest(
     }
 
 
+def generate_data_files(
+    data_dir: Path,
+    seed: int,
+    tweet_count: int,
+    like_count: int,
+    dm_message_count: int,
+    dm_convo_count: int,
+    grok_count: int,
+    jobs: int,
+    threads: bool,
+) -> dict[str, tuple[str, int, int]]:
+    """Generate the four data files; return (SHA256, record count, size) by file name."""
+    rng = random.Random(seed)
+
+    # Draw every random value up front, in the order the generators have
+    # always consumed them, so each file can then be generated independently.
+    tweet_draws = tweet_numerics(rng, tweet_count)
+    dm_hours = draw_hours(rng, dm_convo_count * (dm_message_count // dm_convo_count))
+    grok_hours = draw_hours(rng, grok_count)
+
+    # Buffer small corpora whole; stream large ones to keep memory flat
+    record_count = tweet_count + like_count + dm_message_count + grok_count
+    if record_count * ESTIMATED_BYTES_PER_RECORD < BUFFERED_OUTPUT_LIMIT:
+        block_bytes, write_mode = None, "buffered"
+    else:
+        block_bytes, write_mode = STREAM_BLOCK_BYTES, "streamed"
+
+    # Generate data files in parallel
+    tweets_js, like_js, dms_js, grok_js = DATA_FILES
+    worker_kind = "threads" if threads else "processes"
+    print(f"\nGenerating data files ({jobs} {worker_kind}, {write_mode} writes)...", flush=True)
+    with make_executor(jobs, threads) as executor:
+        tweet_job = executor.submit(generate_js_file, data_dir / tweets_js, "tweets",
+                                    block_bytes, render_tweets, tweet_count, tweet_draws)
+        like_job = executor.submit(generate_js_file, data_dir / like_js, "like",
+                                   block_bytes, render_likes, like_count)
+        dm_job = executor.submit(generate_js_file, data_dir / dms_js,
+                                 "direct_messages", block_bytes, render_direct_messages,
+                                 dm_message_count, dm_convo_count, dm_hours)
+        grok_job = executor.submit(generate_js_file, data_dir / grok_js,
+                                   "grok_chat_item", block_bytes, iter_grok_messages,
+                                   grok_count, grok_hours)
+
+        results = {}
+        results[tweets_js] = tweet_job.result()
+        print(f"  Tweets: done ({results[tweets_js][1]} records)")
+        results[like_js] = like_job.result()
+        print(f"  Likes: done ({results[like_js][1]} records)")
+        results[dms_js] = dm_job.result()
+        print(f"  DMs: done ({dm_message_count} messages in "
+              f"{results[dms_js][1]} conversations)")
+        results[grok_js] = grok_job.result()
+        print(f"  Grok messages: done ({results[grok_js][1]} messages)")
+
+    return results
+
+
+def generator_fingerprint() -> str:
+    """Return the SHA256 of this script, so caches are only reused by identical code."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def load_corpus_cache(cache_dir: Path) -> dict[str, tuple[str, int, bytes]] | None:
+    """Load data files cached by ``save_corpus_cache``, or None if missing or stale.
+
+    The cache is a directory holding the data files and an ``index.json`` with
+    the generator fingerprint and each file's SHA256 and record count. Every
+    file is checked against its recorded SHA256; any mismatch, missing file or
+    malformed index invalidates the whole cache, as does an index listing
+    anything other than exactly ``DATA_FILES``. Returns (SHA256, record
+    count, content) by file name.
+    """
+    try:
+        index = json.loads((cache_dir / "index.json").read_text(encoding="utf-8"))
+        if index["generator"] != generator_fingerprint():
+            return None
+        if set(index["files"]) != set(DATA_FILES):
+            return None
+        files = {}
+        for fname in DATA_FILES:
+            info = index["files"][fname]
+            content = (cache_dir / fname).read_bytes()
+            if hashlib.sha256(content).hexdigest() != info["sha256"]:
+                return None
+            files[fname] = (info["sha256"], int(info["records"]), content)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return files
+
+
+def save_corpus_cache(
+    cache_dir: Path, data_dir: Path, results: dict[str, tuple[str, int, int]]
+) -> None:
+    """Store the generated data files so the next run with this seed and scale can skip generation."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for fname in DATA_FILES:
+        shutil.copyfile(data_dir / fname, cache_dir / fname)
+    index = {
+        "generator": generator_fingerprint(),
+        "files": {
+            fname: {"sha256": results[fname][0], "records": results[fname][1]}
+            for fname in DATA_FILES
+        },
+    }
+    # Write the index last, so it only ever describes fully copied files
+    tmp_index = cache_dir / "index.json.tmp"
+    tmp_index.write_text(json.dumps(index, indent=2), encoding="utf-8")
+    tmp_index.replace(cache_dir / "index.json")
+
+
+def restore_corpus_cache(
+    files: dict[str, tuple[str, int, bytes]], data_dir: Path
+) -> dict[str, tuple[str, int, int]]:
+    """Write cached data files back out; return (SHA256, record count, size) by file name."""
+    results = {}
+    for fname in DATA_FILES:
+        sha, records, content = files[fname]
+        (data_dir / fname).write_bytes(content)
+        results[fname] = (sha, records, len(content))
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate deterministic test corpus for xf")
     parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
@@ -364,10 +735,15 @@ def main():
                        help="Output directory for corpus files")
     parser.add_argument("--scale", type=float, default=1.0,
                        help="Scale factor (1.0 = 17,500 records)")
+    parser.add_argument("--jobs", type=int, default=4,
+                       help="Number of parallel workers (default: 4)")
+    parser.add_argument("--threads", action="store_true",
+                       help="Use worker threads instead of processes")
+    parser.add_argument("--cache", action="store_true",
+                       help="Reuse data files cached in <output-dir>/.cache, and cache new ones")
     args = parser.parse_args()
-
-    # Initialize deterministic RNG
-    rng = random.Random(args.seed)
+    if args.jobs < 1:
+        parser.error("--jobs must be >= 1")
 
     # Calculate counts based on scale
     tweet_count = int(10_000 * args.scale)
@@ -387,47 +763,38 @@ def main():
     print(f"  DM Messages: {dm_message_count} in {dm_convo_count} conversations")
     print(f"  Grok Messages: {grok_count}")
 
-    # Generate data
-    print("\nGenerating tweets...", end=" ", flush=True)
-    tweets = generate_tweets(rng, tweet_count)
-    tweet_hash = write_js_file(data_dir / "tweets.js", "tweets", tweets)
-    print(f"done ({len(tweets)} records)")
-
-    print("Generating likes...", end=" ", flush=True)
-    likes = generate_likes(rng, like_count)
-    like_hash = write_js_file(data_dir / "like.js", "like", likes)
-    print(f"done ({len(likes)} records)")
-
-    print("Generating DMs...", end=" ", flush=True)
-    dms = generate_direct_messages(rng, dm_message_count, dm_convo_count)
-    dm_hash = write_js_file(data_dir / "direct-messages.js", "direct_messages", dms)
-    print(f"done ({dm_message_count} messages in {len(dms)} conversations)")
-
-    print("Generating Grok messages...", end=" ", flush=True)
-    grok = generate_grok_messages(rng, grok_count)
-    grok_hash = write_js_file(data_dir / "grok-chat-item.js", "grok_chat_item", grok)
-    print(f"done ({len(grok)} messages)")
+    cache_dir = output_dir / ".cache" / f"{args.seed}_{args.scale}"
+    cached_files = load_corpus_cache(cache_dir) if args.cache else None
+    if cached_files is not None:
+        print(f"\nRestoring data files from {cache_dir}...", end=" ", flush=True)
+        results = restore_corpus_cache(cached_files, data_dir)
+        print("done")
+    else:
+        results = generate_data_files(
+            data_dir, args.seed, tweet_count, like_count, dm_message_count, dm_convo_count,
+            grok_count, args.jobs, args.threads,
+        )
+        if args.cache:
+            save_corpus_cache(cache_dir, data_dir, results)
+
+    tweets_js, like_js, dms_js, grok_js = DATA_FILES
+    tweet_hash, tweet_records, _ = results[tweets_js]
+    like_hash, like_records, _ = results[like_js]
+    dm_hash, _, _ = results[dms_js]
+    grok_hash, grok_records, _ = results[grok_js]
 
     # Calculate total size and generate X archive manifest.js
-    total_records = len(tweets) + len(likes) + dm_message_count + len(grok)
-    total_size = sum(
-        (data_dir / fname).stat().st_size
-        for fname in [
-            "tweets.js",
-            "like.js",
-            "direct-messages.js",
-            "grok-chat-item.js",
-        ]
-    )
+    total_records = tweet_records + like_records + dm_message_count + grok_records
+    total_size = sum(results[fname][2] for fname in DATA_FILES)
     archive_manifest = generate_manifest(
-        len(tweets),
-        len(likes),
+        tweet_records,
+        like_records,
         dm_message_count,
-        len(grok),
+        grok_records,
         total_size,
     )
     print("Generating manifest.js...", end=" ", flush=True)
-    manifest_js_hash = write_js_file(data_dir / "manifest.js", "manifest", archive_manifest)
+    manifest_js_hash, _ = write_js_file(data_dir / "manifest.js", "manifest", archive_manifest)
     print("done")
 
     # Write corpus manifest with checksums
@@ -437,10 +804,10 @@ def main():
         "generated_at": GENERATION_TIMESTAMP.isoformat(),
         "files": {
             "manifest.js": {"records": 1, "sha256": manifest_js_hash},
-            "tweets.js": {"records": len(tweets), "sha256": tweet_hash},
-            "like.js": {"records": len(likes), "sha256": like_hash},
-            "direct-messages.js": {"records": dm_message_count, "sha256": dm_hash},
-            "grok-chat-item.js": {"records": len(grok), "sha256": grok_hash},
+            tweets_js: {"records": tweet_records, "sha256": tweet_hash},
+            like_js: {"records": like_records, "sha256": like_hash},
+            dms_js: {"records": dm_message_count, "sha256": dm_hash},
+            grok_js: {"records": grok_records, "sha256": grok_hash},
         },
         "total_records": total_records,
     }
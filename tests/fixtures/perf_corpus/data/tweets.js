@@ -1460,7 +1460,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000050",
       "id_str": "1000000000050",
       "created_at": "Mon Jan 11 19:45:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "31",
@@ -4405,7 +4405,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000150",
       "id_str": "1000000000150",
       "created_at": "Fri Jan 29 16:03:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "736",
@@ -5890,7 +5890,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000200",
       "id_str": "1000000000200",
       "created_at": "Sun Feb 07 17:42:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and e",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and e",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "481",
@@ -7350,7 +7350,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000250",
       "id_str": "1000000000250",
       "created_at": "Wed Feb 17 05:16:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "443",
@@ -10295,7 +10295,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000350",
       "id_str": "1000000000350",
       "created_at": "Sat Mar 06 15:59:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "386",
@@ -13240,7 +13240,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000450",
       "id_str": "1000000000450",
       "created_at": "Fri Mar 26 03:58:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "944",
@@ -14725,7 +14725,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000500",
       "id_str": "1000000000500",
       "created_at": "Sat Apr 03 18:42:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 ",
+      "full_text": "@rustlang Testing unicode support: café ",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "28",
@@ -16185,7 +16185,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000550",
       "id_str": "1000000000550",
       "created_at": "Mon Apr 12 18:36:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "271",
@@ -19130,7 +19130,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000650",
       "id_str": "1000000000650",
       "created_at": "Sat May 01 09:08:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "895",
@@ -22075,7 +22075,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000750",
       "id_str": "1000000000750",
       "created_at": "Tue May 18 23:25:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "448",
@@ -25020,7 +25020,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000850",
       "id_str": "1000000000850",
       "created_at": "Sun Jun 06 13:04:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "213",
@@ -27965,7 +27965,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000000950",
       "id_str": "1000000000950",
       "created_at": "Fri Jun 25 04:30:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "847",
@@ -29450,7 +29450,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001000",
       "id_str": "1000000001000",
       "created_at": "Sun Jul 04 04:03:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615",
+      "full_text": "@rustlang Testing unicode support: café ☕",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "268",
@@ -30910,7 +30910,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001050",
       "id_str": "1000000001050",
       "created_at": "Mon Jul 12 20:39:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "444",
@@ -32395,7 +32395,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001100",
       "id_str": "1000000001100",
       "created_at": "Wed Jul 21 21:00:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f",
+      "full_text": "@rustlang Testing unicode support: café ☕️",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "524",
@@ -33855,7 +33855,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001150",
       "id_str": "1000000001150",
       "created_at": "Sat Jul 31 02:03:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "450",
@@ -36800,7 +36800,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001250",
       "id_str": "1000000001250",
       "created_at": "Thu Aug 19 06:37:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "483",
@@ -39745,7 +39745,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001350",
       "id_str": "1000000001350",
       "created_at": "Mon Sep 06 03:55:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "337",
@@ -42690,7 +42690,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001450",
       "id_str": "1000000001450",
       "created_at": "Fri Sep 24 04:48:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "124",
@@ -45635,7 +45635,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001550",
       "id_str": "1000000001550",
       "created_at": "Tue Oct 12 02:44:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "9",
@@ -48580,7 +48580,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001650",
       "id_str": "1000000001650",
       "created_at": "Sat Oct 30 12:21:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "548",
@@ -51525,7 +51525,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001750",
       "id_str": "1000000001750",
       "created_at": "Thu Nov 18 09:30:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "164",
@@ -54470,7 +54470,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001850",
       "id_str": "1000000001850",
       "created_at": "Sun Dec 05 17:57:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "14",
@@ -57415,7 +57415,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000001950",
       "id_str": "1000000001950",
       "created_at": "Thu Dec 23 16:06:00 +0000 2021",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "754",
@@ -60360,7 +60360,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002050",
       "id_str": "1000000002050",
       "created_at": "Tue Jan 11 12:14:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "494",
@@ -63305,7 +63305,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002150",
       "id_str": "1000000002150",
       "created_at": "Sun Jan 30 11:59:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "267",
@@ -66250,7 +66250,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002250",
       "id_str": "1000000002250",
       "created_at": "Wed Feb 16 22:43:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "661",
@@ -69195,7 +69195,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002350",
       "id_str": "1000000002350",
       "created_at": "Mon Mar 07 05:35:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "663",
@@ -72140,7 +72140,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002450",
       "id_str": "1000000002450",
       "created_at": "Fri Mar 25 22:13:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "43",
@@ -73625,7 +73625,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002500",
       "id_str": "1000000002500",
       "created_at": "Mon Apr 04 01:03:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f an",
+      "full_text": "@rustlang Testing unicode support: café ☕️ an",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "21",
@@ -75085,7 +75085,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002550",
       "id_str": "1000000002550",
       "created_at": "Wed Apr 13 06:36:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "555",
@@ -76570,7 +76570,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002600",
       "id_str": "1000000002600",
       "created_at": "Fri Apr 22 09:56:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and em",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and em",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "231",
@@ -78030,7 +78030,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002650",
       "id_str": "1000000002650",
       "created_at": "Sat Apr 30 15:46:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "299",
@@ -80975,7 +80975,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002750",
       "id_str": "1000000002750",
       "created_at": "Thu May 19 04:56:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "106",
@@ -83920,7 +83920,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002850",
       "id_str": "1000000002850",
       "created_at": "Mon Jun 06 21:34:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "335",
@@ -85405,7 +85405,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002900",
       "id_str": "1000000002900",
       "created_at": "Thu Jun 16 10:28:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 ",
+      "full_text": "@rustlang Testing unicode support: café ",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "581",
@@ -86865,7 +86865,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000002950",
       "id_str": "1000000002950",
       "created_at": "Sat Jun 25 08:45:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "324",
@@ -89810,7 +89810,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003050",
       "id_str": "1000000003050",
       "created_at": "Tue Jul 12 14:41:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "546",
@@ -91295,7 +91295,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003100",
       "id_str": "1000000003100",
       "created_at": "Fri Jul 22 05:39:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301",
+      "full_text": "@rustlang Testing unicode support: café",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "677",
@@ -92755,7 +92755,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003150",
       "id_str": "1000000003150",
       "created_at": "Sun Jul 31 11:17:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "679",
@@ -94240,7 +94240,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003200",
       "id_str": "1000000003200",
       "created_at": "Mon Aug 08 22:27:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and ",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and ",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "600",
@@ -95700,7 +95700,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003250",
       "id_str": "1000000003250",
       "created_at": "Thu Aug 18 18:35:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "133",
@@ -98645,7 +98645,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003350",
       "id_str": "1000000003350",
       "created_at": "Tue Sep 06 09:49:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "307",
@@ -101590,7 +101590,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003450",
       "id_str": "1000000003450",
       "created_at": "Sat Sep 24 09:20:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "21",
@@ -104535,7 +104535,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003550",
       "id_str": "1000000003550",
       "created_at": "Wed Oct 12 06:21:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "494",
@@ -107480,7 +107480,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003650",
       "id_str": "1000000003650",
       "created_at": "Mon Oct 31 07:20:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "125",
@@ -110425,7 +110425,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003750",
       "id_str": "1000000003750",
       "created_at": "Thu Nov 17 16:46:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "297",
@@ -113370,7 +113370,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003850",
       "id_str": "1000000003850",
       "created_at": "Tue Dec 06 10:08:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "3",
@@ -116315,7 +116315,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000003950",
       "id_str": "1000000003950",
       "created_at": "Sat Dec 24 01:01:00 +0000 2022",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "247",
@@ -119260,7 +119260,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004050",
       "id_str": "1000000004050",
       "created_at": "Thu Jan 12 04:31:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "8",
@@ -122205,7 +122205,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004150",
       "id_str": "1000000004150",
       "created_at": "Mon Jan 30 01:41:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "271",
@@ -125150,7 +125150,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004250",
       "id_str": "1000000004250",
       "created_at": "Thu Feb 16 22:56:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "522",
@@ -128095,7 +128095,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004350",
       "id_str": "1000000004350",
       "created_at": "Tue Mar 07 08:06:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "373",
@@ -131040,7 +131040,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004450",
       "id_str": "1000000004450",
       "created_at": "Sat Mar 25 22:44:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "60",
@@ -133985,7 +133985,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004550",
       "id_str": "1000000004550",
       "created_at": "Wed Apr 12 14:49:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "368",
@@ -136930,7 +136930,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004650",
       "id_str": "1000000004650",
       "created_at": "Sun Apr 30 19:33:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "119",
@@ -138415,7 +138415,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004700",
       "id_str": "1000000004700",
       "created_at": "Wed May 10 08:31:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 ",
+      "full_text": "@rustlang Testing unicode support: café ",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "227",
@@ -139875,7 +139875,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004750",
       "id_str": "1000000004750",
       "created_at": "Thu May 18 23:23:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "88",
@@ -142820,7 +142820,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004850",
       "id_str": "1000000004850",
       "created_at": "Tue Jun 06 19:38:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "363",
@@ -145765,7 +145765,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000004950",
       "id_str": "1000000004950",
       "created_at": "Sun Jun 25 06:12:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "134",
@@ -148710,7 +148710,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005050",
       "id_str": "1000000005050",
       "created_at": "Thu Jul 13 11:33:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "386",
@@ -150195,7 +150195,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005100",
       "id_str": "1000000005100",
       "created_at": "Fri Jul 21 13:05:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 ",
+      "full_text": "@rustlang Testing unicode support: café ",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "362",
@@ -151655,7 +151655,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005150",
       "id_str": "1000000005150",
       "created_at": "Mon Jul 31 01:54:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "0",
@@ -153140,7 +153140,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005200",
       "id_str": "1000000005200",
       "created_at": "Wed Aug 09 04:08:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and ",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and ",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "422",
@@ -154600,7 +154600,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005250",
       "id_str": "1000000005250",
       "created_at": "Sat Aug 19 02:58:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "293",
@@ -157545,7 +157545,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005350",
       "id_str": "1000000005350",
       "created_at": "Wed Sep 06 00:37:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "265",
@@ -160490,7 +160490,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005450",
       "id_str": "1000000005450",
       "created_at": "Sun Sep 24 06:02:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "447",
@@ -163435,7 +163435,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005550",
       "id_str": "1000000005550",
       "created_at": "Thu Oct 12 04:55:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "309",
@@ -166380,7 +166380,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005650",
       "id_str": "1000000005650",
       "created_at": "Mon Oct 30 22:26:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "66",
@@ -169325,7 +169325,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005750",
       "id_str": "1000000005750",
       "created_at": "Fri Nov 17 12:02:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "22",
@@ -172270,7 +172270,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005850",
       "id_str": "1000000005850",
       "created_at": "Wed Dec 06 02:52:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "353",
@@ -173755,7 +173755,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005900",
       "id_str": "1000000005900",
       "created_at": "Thu Dec 14 20:32:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "95",
@@ -175215,7 +175215,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000005950",
       "id_str": "1000000005950",
       "created_at": "Sun Dec 24 05:17:00 +0000 2023",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "73",
@@ -176700,7 +176700,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006000",
       "id_str": "1000000006000",
       "created_at": "Mon Jan 01 17:09:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f a",
+      "full_text": "@rustlang Testing unicode support: café ☕️ a",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "103",
@@ -178160,7 +178160,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006050",
       "id_str": "1000000006050",
       "created_at": "Thu Jan 11 14:50:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "186",
@@ -181105,7 +181105,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006150",
       "id_str": "1000000006150",
       "created_at": "Mon Jan 29 20:40:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "278",
@@ -184050,7 +184050,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006250",
       "id_str": "1000000006250",
       "created_at": "Fri Feb 16 23:52:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "180",
@@ -186995,7 +186995,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006350",
       "id_str": "1000000006350",
       "created_at": "Wed Mar 06 09:27:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "240",
@@ -188480,7 +188480,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006400",
       "id_str": "1000000006400",
       "created_at": "Thu Mar 14 21:14:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f a",
+      "full_text": "@rustlang Testing unicode support: café ☕️ a",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "244",
@@ -189940,7 +189940,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006450",
       "id_str": "1000000006450",
       "created_at": "Sun Mar 24 17:41:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "207",
@@ -192885,7 +192885,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006550",
       "id_str": "1000000006550",
       "created_at": "Fri Apr 12 07:59:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "235",
@@ -195830,7 +195830,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006650",
       "id_str": "1000000006650",
       "created_at": "Tue Apr 30 10:20:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "96",
@@ -198775,7 +198775,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006750",
       "id_str": "1000000006750",
       "created_at": "Sat May 18 05:16:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "32",
@@ -200260,7 +200260,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006800",
       "id_str": "1000000006800",
       "created_at": "Mon May 27 10:38:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and em",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and em",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "101",
@@ -201720,7 +201720,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006850",
       "id_str": "1000000006850",
       "created_at": "Thu Jun 06 05:34:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "258",
@@ -204665,7 +204665,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000006950",
       "id_str": "1000000006950",
       "created_at": "Mon Jun 24 08:35:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "176",
@@ -207610,7 +207610,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007050",
       "id_str": "1000000007050",
       "created_at": "Fri Jul 12 10:14:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "9",
@@ -210555,7 +210555,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007150",
       "id_str": "1000000007150",
       "created_at": "Mon Jul 29 20:55:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "104",
@@ -212040,7 +212040,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007200",
       "id_str": "1000000007200",
       "created_at": "Thu Aug 08 03:52:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "189",
@@ -213500,7 +213500,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007250",
       "id_str": "1000000007250",
       "created_at": "Sat Aug 17 23:33:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "227",
@@ -216445,7 +216445,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007350",
       "id_str": "1000000007350",
       "created_at": "Thu Sep 05 02:23:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "256",
@@ -217930,7 +217930,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007400",
       "id_str": "1000000007400",
       "created_at": "Fri Sep 13 12:33:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615",
+      "full_text": "@rustlang Testing unicode support: café ☕",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "65",
@@ -219390,7 +219390,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007450",
       "id_str": "1000000007450",
       "created_at": "Mon Sep 23 05:43:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "25",
@@ -222335,7 +222335,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007550",
       "id_str": "1000000007550",
       "created_at": "Thu Oct 10 17:11:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "131",
@@ -225280,7 +225280,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007650",
       "id_str": "1000000007650",
       "created_at": "Tue Oct 29 16:37:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "212",
@@ -228225,7 +228225,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007750",
       "id_str": "1000000007750",
       "created_at": "Sat Nov 16 20:33:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "40",
@@ -231170,7 +231170,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007850",
       "id_str": "1000000007850",
       "created_at": "Thu Dec 05 02:41:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "36",
@@ -234115,7 +234115,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000007950",
       "id_str": "1000000007950",
       "created_at": "Sun Dec 22 12:22:00 +0000 2024",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "198",
@@ -237060,7 +237060,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008050",
       "id_str": "1000000008050",
       "created_at": "Fri Jan 10 18:46:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "38",
@@ -240005,7 +240005,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008150",
       "id_str": "1000000008150",
       "created_at": "Wed Jan 29 03:35:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "160",
@@ -242950,7 +242950,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008250",
       "id_str": "1000000008250",
       "created_at": "Sun Feb 16 00:08:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "13",
@@ -245895,7 +245895,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008350",
       "id_str": "1000000008350",
       "created_at": "Wed Mar 05 23:20:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "114",
@@ -248840,7 +248840,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008450",
       "id_str": "1000000008450",
       "created_at": "Mon Mar 24 14:01:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "62",
@@ -251785,7 +251785,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008550",
       "id_str": "1000000008550",
       "created_at": "Sat Apr 12 00:58:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "126",
@@ -254730,7 +254730,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008650",
       "id_str": "1000000008650",
       "created_at": "Wed Apr 30 07:33:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "97",
@@ -256215,7 +256215,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008700",
       "id_str": "1000000008700",
       "created_at": "Thu May 08 14:37:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and e",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and e",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "129",
@@ -257675,7 +257675,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008750",
       "id_str": "1000000008750",
       "created_at": "Sat May 17 22:17:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "8",
@@ -260620,7 +260620,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008850",
       "id_str": "1000000008850",
       "created_at": "Fri Jun 06 01:38:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "18",
@@ -263565,7 +263565,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000008950",
       "id_str": "1000000008950",
       "created_at": "Tue Jun 24 01:22:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "68",
@@ -266510,7 +266510,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009050",
       "id_str": "1000000009050",
       "created_at": "Fri Jul 11 23:34:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "5",
@@ -269455,7 +269455,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009150",
       "id_str": "1000000009150",
       "created_at": "Tue Jul 29 19:33:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "51",
@@ -272400,7 +272400,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009250",
       "id_str": "1000000009250",
       "created_at": "Sun Aug 17 21:44:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "62",
@@ -275345,7 +275345,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009350",
       "id_str": "1000000009350",
       "created_at": "Thu Sep 04 21:30:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #javascript #cloud",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #javascript #cloud",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "25",
@@ -278290,7 +278290,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009450",
       "id_str": "1000000009450",
       "created_at": "Mon Sep 22 23:31:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #rust #programming",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #rust #programming",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "11",
@@ -281235,7 +281235,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009550",
       "id_str": "1000000009550",
       "created_at": "Sat Oct 11 00:22:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #tech #coding",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #tech #coding",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "12",
@@ -284180,7 +284180,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009650",
       "id_str": "1000000009650",
       "created_at": "Wed Oct 29 15:11:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #software #dev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #software #dev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "18",
@@ -285665,7 +285665,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009700",
       "id_str": "1000000009700",
       "created_at": "Sat Nov 08 06:39:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and ",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and ",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "8",
@@ -287125,7 +287125,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009750",
       "id_str": "1000000009750",
       "created_at": "Sun Nov 16 16:01:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #opensource #machinelearning",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #opensource #machinelearning",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "11",
@@ -290070,7 +290070,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009850",
       "id_str": "1000000009850",
       "created_at": "Fri Dec 05 05:54:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #ai #webdev",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #ai #webdev",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "7",
@@ -291555,7 +291555,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009900",
       "id_str": "1000000009900",
       "created_at": "Sun Dec 14 02:54:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and ",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and ",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "3",
@@ -293015,7 +293015,7 @@ window.YTD.tweets.part0 = [
       "id": "1000000009950",
       "id_str": "1000000009950",
       "created_at": "Mon Dec 22 21:18:00 +0000 2025",
-      "full_text": "@rustlang Testing unicode support: cafe\u0301 \u2615\ufe0f and emojis \ud83c\udf89\ud83d\ude80 #linux #python",
+      "full_text": "@rustlang Testing unicode support: café ☕️ and emojis 🎉🚀 #linux #python",
       "truncated": false,
       "source": "<a href=\"https://mobile.x.com\" rel=\"nofollow\">X for iPhone</a>",
       "favorite_count": "0",